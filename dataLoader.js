@@ -1,42 +1,92 @@
 class DataLoader {
-    static async loadCSV(file, delimiter = '\t') {
+    static async loadDataset(file, delimiter = '\t') {
         return new Promise((resolve, reject) => {
+            // Rows are streamed chunk by chunk into the dataset builder, so the
+            // full parse result for the file is never held in memory at once.
+            const builder = this.createDatasetBuilder();
+            let totalRows = 0;
+            let validCount = 0;
+            let headerChecked = false;
+            let failed = false;
+
+            const fail = (error, parser) => {
+                failed = true;
+                if (parser) parser.abort();
+                reject(error);
+            };
+
             Papa.parse(file, {
                 header: true,
                 dynamicTyping: true,
                 delimiter: delimiter,
                 skipEmptyLines: true,
-                transform: function(value) {
-                    return typeof value === 'string' ? value.trim() : value;
-                },
-                complete: (results) => {
+                // Parse off the main thread so the UI and any running training
+                // loop are not blocked. Functions such as `transform` cannot be
+                // posted to the worker, so values are trimmed per chunk.
+                worker: true,
+                chunk: (results, parser) => {
+                    if (failed) return;
                     if (results.errors.length > 0) {
-                        reject(new Error(results.errors[0].message));
-                    } else {
-                        const validation = this.validateDataFormat(results.data);
-                        if (!validation.isValid) {
-                            reject(new Error(validation.message));
-                        } else {
-                            this.validateFeatureFields(results.data);
-                            resolve(results.data);
+                        fail(new Error(results.errors[0].message), parser);
+                        return;
+                    }
+
+                    if (!headerChecked) {
+                        const fields = results.meta.fields || [];
+                        const missingFields = this.getMissingRequiredFields(fields);
+                        if (missingFields.length > 0) {
+                            fail(new Error(`Missing required fields: ${missingFields.join(', ')}. Found fields: ${fields.join(', ')}`), parser);
+                            return;
                         }
+                        headerChecked = true;
+                    }
+
+                    const rows = this.trimValues(results.data);
+                    if (rows.length === 0) return;
+
+                    if (totalRows === 0) {
+                        this.validateFeatureFields(rows);
+                    }
+
+                    totalRows += rows.length;
+                    validCount += this.countValidSamples(rows);
+                    builder.add(rows);
+                },
+                complete: () => {
+                    if (failed) return;
+                    if (totalRows === 0) {
+                        reject(new Error('No data found in file'));
+                    } else if (validCount === 0) {
+                        reject(new Error(`Found ${validCount} valid samples out of ${totalRows} total rows`));
+                    } else {
+                        resolve(builder.finish());
                     }
                 },
                 error: (error) => {
-                    reject(error);
+                    fail(error);
                 }
             });
         });
     }
 
+    static trimValues(data) {
+        for (const row of data) {
+            for (const key in row) {
+                if (typeof row[key] === 'string') {
+                    row[key] = row[key].trim();
+                }
+            }
+        }
+        return data;
+    }
+
     static validateDataFormat(data) {
         if (!data || data.length === 0) {
             return { isValid: false, message: 'No data found in file' };
         }
 
         const firstRow = data[0];
-        const requiredFields = ['Sequence', 'Class_Label'];
-        const missingFields = requiredFields.filter(field => !(field in firstRow));
+        const missingFields = this.getMissingRequiredFields(Object.keys(firstRow));
 
         if (missingFields.length > 0) {
             return { 
@@ -45,12 +95,7 @@ class DataLoader {
             };
         }
 
-        let validCount = 0;
-        for (const row of data) {
-            if (row.Sequence && row.Class_Label && /^[ATCGatcg]+$/.test(row.Sequence.toString())) {
-                validCount++;
-            }
-        }
+        const validCount = this.countValidSamples(data);
 
         return {
             isValid: validCount > 0,
@@ -59,6 +104,21 @@ class DataLoader {
         };
     }
 
+    static getMissingRequiredFields(fields) {
+        const requiredFields = ['Sequence', 'Class_Label'];
+        return requiredFields.filter(field => !fields.includes(field));
+    }
+
+    static countValidSamples(data) {
+        let validCount = 0;
+        for (const row of data) {
+            if (row.Sequence && row.Class_Label && /^[ATCGatcg]+$/.test(row.Sequence.toString())) {
+                validCount++;
+            }
+        }
+        return validCount;
+    }
+
     static validateFeatureFields(data) {
         if (!data || data.length === 0) return;
 
@@ -75,108 +135,173 @@ class DataLoader {
     }
 
     static analyzeData(data) {
+        const analyzer = this.createAnalyzer();
+        analyzer.add(data);
+        return analyzer.finish();
+    }
+
+    static createAnalyzer() {
+        const features = ['GC_Content', 'AT_Content', 'Sequence_Length', 'kmer_3_freq'];
+        const accumulators = features.map(() => ({
+            count: 0, mean: 0, m2: 0, min: Infinity, max: -Infinity
+        }));
         const analysis = {
-            totalSamples: data.length,
+            totalSamples: 0,
             classDistribution: {},
             featureStats: {},
             sequenceLengths: []
         };
 
-        data.forEach(row => {
-            const label = row.Class_Label;
-            analysis.classDistribution[label] = (analysis.classDistribution[label] || 0) + 1;
-            
-            if (row.Sequence) {
-                analysis.sequenceLengths.push(row.Sequence.length);
-            }
-        });
+        const add = (rows) => {
+            analysis.totalSamples += rows.length;
 
-        const features = ['GC_Content', 'AT_Content', 'Sequence_Length', 'kmer_3_freq'];
-        features.forEach(feature => {
-            const values = data.map(row => parseFloat(row[feature])).filter(v => !isNaN(v));
-            if (values.length > 0) {
-                analysis.featureStats[feature] = {
-                    min: Math.min(...values),
-                    max: Math.max(...values),
-                    mean: values.reduce((a, b) => a + b, 0) / values.length,
-                    std: Math.sqrt(values.reduce((sq, n) => sq + Math.pow(n - values.reduce((a, b) => a + b, 0) / values.length, 2), 0) / values.length)
-                };
+            for (const row of rows) {
+                const label = row.Class_Label;
+                analysis.classDistribution[label] = (analysis.classDistribution[label] || 0) + 1;
+                
+                if (row.Sequence) {
+                    analysis.sequenceLengths.push(row.Sequence.length);
+                }
+
+                for (let i = 0; i < features.length; i++) {
+                    const value = parseFloat(row[features[i]]);
+                    if (isNaN(value)) continue;
+
+                    const acc = accumulators[i];
+                    acc.count++;
+                    const delta = value - acc.mean;
+                    acc.mean += delta / acc.count;
+                    acc.m2 += delta * (value - acc.mean);
+                    if (value < acc.min) acc.min = value;
+                    if (value > acc.max) acc.max = value;
+                }
             }
-        });
+        };
+
+        const finish = () => {
+            features.forEach((feature, i) => {
+                const acc = accumulators[i];
+                if (acc.count > 0) {
+                    analysis.featureStats[feature] = {
+                        min: acc.min,
+                        max: acc.max,
+                        mean: acc.mean,
+                        std: Math.sqrt(acc.m2 / acc.count)
+                    };
+                }
+            });
+            return analysis;
+        };
 
-        return analysis;
+        return { add, finish };
     }
 
-    static normalizeFeatures(features) {
-        if (features.length === 0) return features;
-        
-        const numFeatures = features[0].length;
-        const normalized = [];
-        
-        const means = [];
-        const stds = [];
-        
+    static normalizeFeatures(matrix, numFeatures) {
+        const numSamples = matrix.length / numFeatures;
+        if (numSamples === 0) return matrix;
+
+        const means = new Float64Array(numFeatures);
+        const stds = new Float64Array(numFeatures);
+
+        for (let offset = 0; offset < matrix.length; offset += numFeatures) {
+            for (let i = 0; i < numFeatures; i++) {
+                means[i] += matrix[offset + i];
+            }
+        }
         for (let i = 0; i < numFeatures; i++) {
-            const featureValues = features.map(f => f[i]);
-            const mean = featureValues.reduce((a, b) => a + b, 0) / featureValues.length;
-            const std = Math.sqrt(featureValues.reduce((sq, n) => sq + Math.pow(n - mean, 2), 0) / featureValues.length);
-            
-            means.push(mean);
-            stds.push(std || 1);
+            means[i] /= numSamples;
         }
-        
-        for (const feature of features) {
-            const normalizedFeature = feature.map((value, i) => {
-                return (value - means[i]) / stds[i];
-            });
-            normalized.push(normalizedFeature);
+
+        for (let offset = 0; offset < matrix.length; offset += numFeatures) {
+            for (let i = 0; i < numFeatures; i++) {
+                const diff = matrix[offset + i] - means[i];
+                stds[i] += diff * diff;
+            }
         }
-        
-        return normalized;
+        for (let i = 0; i < numFeatures; i++) {
+            stds[i] = Math.sqrt(stds[i] / numSamples) || 1;
+        }
+
+        for (let offset = 0; offset < matrix.length; offset += numFeatures) {
+            for (let i = 0; i < numFeatures; i++) {
+                matrix[offset + i] = (matrix[offset + i] - means[i]) / stds[i];
+            }
+        }
+
+        return matrix;
     }
 
     static processData(rawData) {
-        const features = [];
+        const builder = this.createDatasetBuilder();
+        builder.add(rawData);
+        return builder.finish();
+    }
+
+    static createDatasetBuilder() {
+        const numFeatures = DataLoader.NUM_FEATURES;
+        const analyzer = this.createAnalyzer();
+        let buffer = new Float32Array(0);
         const labels = [];
         const processedData = [];
 
-        const analysis = this.analyzeData(rawData);
+        const add = (rows) => {
+            analyzer.add(rows);
+
+            const required = (labels.length + rows.length) * numFeatures;
+            if (required > buffer.length) {
+                const grown = new Float32Array(Math.max(required, buffer.length * 2));
+                grown.set(buffer);
+                buffer = grown;
+            }
 
-        for (const row of rawData) {
-            if (!row.Sequence || !row.Class_Label) continue;
+            for (const row of rows) {
+                if (!row.Sequence || !row.Class_Label) continue;
 
-            const featureVector = this.extractFeaturesFromRow(row);
-            const labelIndex = this.getClassLabelIndex(row.Class_Label);
+                const offset = labels.length * numFeatures;
+                const featureVector = this.extractFeaturesFromRow(row, buffer, offset);
+                const labelIndex = this.getClassLabelIndex(row.Class_Label);
 
-            if (featureVector && labelIndex !== -1) {
-                features.push(featureVector);
-                labels.push(labelIndex);
-                processedData.push(row);
+                if (featureVector && labelIndex !== -1) {
+                    labels.push(labelIndex);
+                    // Only the fields shown in results are kept per sample.
+                    processedData.push({ Sequence: row.Sequence, Class_Label: row.Class_Label });
+                }
             }
-        }
+        };
 
-        const normalizedFeatures = this.normalizeFeatures(features);
+        const finish = () => {
+            // Rows are normalized in place inside one contiguous buffer; features[i]
+            // is a view onto row i, so no per-sample arrays are allocated.
+            const featureMatrix = this.normalizeFeatures(
+                buffer.subarray(0, labels.length * numFeatures), numFeatures
+            );
+            const features = labels.map((_, i) => 
+                featureMatrix.subarray(i * numFeatures, (i + 1) * numFeatures)
+            );
 
-        return { 
-            features: normalizedFeatures, 
-            labels, 
-            rawData: processedData,
-            analysis: analysis
+            return { 
+                features, 
+                featureMatrix,
+                labels, 
+                rawData: processedData,
+                analysis: analyzer.finish()
+            };
         };
+
+        return { add, finish };
     }
 
-    static extractFeaturesFromRow(row) {
+    static extractFeaturesFromRow(row, out = new Array(DataLoader.NUM_FEATURES), offset = 0) {
         try {
-            return [
-                this.parseNumber(row.GC_Content),
-                this.parseNumber(row.AT_Content),
-                this.parseNumber(row.Sequence_Length),
-                this.parseNumber(row.Num_A),
-                this.parseNumber(row.Num_T),
-                this.parseNumber(row.Num_C),
-                this.parseNumber(row.Num_G),
-                this.parseNumber(row.kmer_3_freq)
-            ];
+            out[offset] = this.parseNumber(row.GC_Content);
+            out[offset + 1] = this.parseNumber(row.AT_Content);
+            out[offset + 2] = this.parseNumber(row.Sequence_Length);
+            out[offset + 3] = this.parseNumber(row.Num_A);
+            out[offset + 4] = this.parseNumber(row.Num_T);
+            out[offset + 5] = this.parseNumber(row.Num_C);
+            out[offset + 6] = this.parseNumber(row.Num_G);
+            out[offset + 7] = this.parseNumber(row.kmer_3_freq);
+            return out;
         } catch (error) {
             console.error('Feature extraction error:', error, row);
             return null;
@@ -192,40 +317,64 @@ class DataLoader {
         return 0;
     }
 
-    static extractFeaturesFromSequence(sequence, k = 3) {
-        const cleanSequence = sequence.replace(/[^ATCGatcg]/g, '').toUpperCase();
-        
-        if (cleanSequence.length === 0) {
-            return new Array(8).fill(0);
-        }
-        
-        const numA = (cleanSequence.match(/A/g) || []).length;
-        const numT = (cleanSequence.match(/T/g) || []).length;
-        const numC = (cleanSequence.match(/C/g) || []).length;
-        const numG = (cleanSequence.match(/G/g) || []).length;
-        const sequenceLength = cleanSequence.length;
+    static extractFeaturesFromSequence(sequence, k = 3, out = new Array(DataLoader.NUM_FEATURES)) {
+        const table = DataLoader.BASE_LOOKUP;
+        // Each base is a 2-bit code, so a k-mer packs into a 2k-bit table index.
+        const mask = (1 << (2 * k)) - 1;
+        const seen = new Uint8Array(mask + 1);
+        const counts = [0, 0, 0, 0];
+        let sequenceLength = 0;
+        let kmer = 0;
+        let distinctKmers = 0;
 
-        const gcContent = (numG + numC) / sequenceLength;
-        const atContent = (numA + numT) / sequenceLength;
-        const kmer3Freq = this.calculateKmerFrequency(cleanSequence, k);
+        for (let i = 0; i < sequence.length; i++) {
+            const code = sequence.charCodeAt(i);
+            const base = code < 256 ? table[code] : DataLoader.INVALID_BASE;
+            if (base === DataLoader.INVALID_BASE) continue;
 
-        return [gcContent, atContent, sequenceLength, numA, numT, numC, numG, kmer3Freq];
-    }
+            counts[base]++;
+            kmer = ((kmer << 2) | base) & mask;
+            if (++sequenceLength >= k && !seen[kmer]) {
+                seen[kmer] = 1;
+                distinctKmers++;
+            }
+        }
 
-    static calculateKmerFrequency(sequence, k) {
-        if (sequence.length < k) return 0;
-        
-        const kmers = new Map();
-        for (let i = 0; i <= sequence.length - k; i++) {
-            const kmer = sequence.substring(i, i + k);
-            kmers.set(kmer, (kmers.get(kmer) || 0) + 1);
+        if (sequenceLength === 0) {
+            return out.fill(0);
         }
-        return kmers.size > 0 ? (sequence.length - k + 1) / kmers.size : 0;
+
+        const [numA, numT, numC, numG] = counts;
+        out[0] = (numG + numC) / sequenceLength;
+        out[1] = (numA + numT) / sequenceLength;
+        out[2] = sequenceLength;
+        out[3] = numA;
+        out[4] = numT;
+        out[5] = numC;
+        out[6] = numG;
+        out[7] = distinctKmers > 0 ? (sequenceLength - k + 1) / distinctKmers : 0;
+
+        return out;
     }
 
     static getClassLabelIndex(label) {
-        const labels = ['Human', 'Bacteria', 'Virus', 'Plant'];
-        const cleanLabel = String(label).trim();
-        return labels.indexOf(cleanLabel);
+        const index = DataLoader.CLASS_LABEL_INDEX.get(String(label).trim());
+        return index === undefined ? -1 : index;
     }
 }
+
+DataLoader.NUM_FEATURES = 8;
+DataLoader.CLASS_LABELS = ['Human', 'Bacteria', 'Virus', 'Plant'];
+DataLoader.CLASS_LABEL_INDEX = new Map(DataLoader.CLASS_LABELS.map((label, index) => [label, index]));
+DataLoader.BASES = ['A', 'T', 'C', 'G'];
+DataLoader.INVALID_BASE = 255;
+
+// Maps a character code to its base index (A=0, T=1, C=2, G=3), case-insensitive.
+DataLoader.BASE_LOOKUP = (() => {
+    const table = new Uint8Array(256).fill(DataLoader.INVALID_BASE);
+    DataLoader.BASES.forEach((base, index) => {
+        table[base.charCodeAt(0)] = index;
+        table[base.toLowerCase().charCodeAt(0)] = index;
+    });
+    return table;
+})();
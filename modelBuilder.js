@@ -14,6 +14,34 @@ class ModelBuilder {
         }
     }
 
+    static async warmUp(model) {
+        const inputShape = [1, ...model.inputs[0].shape.slice(1)];
+        const backend = tf.backend();
+
+        // WebGL compiles each shader program lazily on first use, keyed by input
+        // shape. In compile-only mode the batch-1 inference programs are compiled
+        // in parallel up front, so the first single-sequence prediction does not
+        // stall on them one kernel at a time. Training shapes are not covered.
+        const parallelCompile = tf.getBackend() === 'webgl' &&
+            typeof backend.checkCompileCompletionAsync === 'function';
+
+        let output;
+        if (parallelCompile) tf.env().set('ENGINE_COMPILE_ONLY', true);
+        try {
+            output = tf.tidy(() => model.predict(tf.zeros(inputShape)));
+        } finally {
+            if (parallelCompile) tf.env().set('ENGINE_COMPILE_ONLY', false);
+        }
+
+        if (parallelCompile) {
+            await backend.checkCompileCompletionAsync();
+            backend.getUniformLocations();
+        } else {
+            await output.data();
+        }
+        tf.dispose(output);
+    }
+
     static createImprovedDenseModel(inputDim, outputDim) {
         const model = tf.sequential();
         
@@ -52,7 +80,7 @@ class ModelBuilder {
 
         model.compile({
             optimizer: tf.train.adam(0.001),
-            loss: 'categoricalCrossentropy',
+            loss: 'sparseCategoricalCrossentropy',
             metrics: ['accuracy']
         });
 
@@ -60,6 +88,8 @@ class ModelBuilder {
     }
 
     static createCNNModel(inputDim, outputDim) {
+        const stemFilters = 64;
+        const blockFilters = 32;
         const model = tf.sequential();
         
         model.add(tf.layers.reshape({
@@ -67,25 +97,32 @@ class ModelBuilder {
             targetShape: [inputDim, 1]
         }));
         
+        // Strided stem conv: downsamples by 2 without a pooling layer.
         model.add(tf.layers.conv1d({
-            filters: 64,
+            filters: stemFilters,
             kernelSize: 3,
-            activation: 'relu',
-            padding: 'same'
+            strides: 2,
+            padding: 'same',
+            useBias: false
         }));
         
         model.add(tf.layers.batchNormalization());
-        model.add(tf.layers.maxPooling1d({ poolSize: 2 }));
+        model.add(tf.layers.activation({ activation: 'relu' }));
         model.add(tf.layers.dropout({ rate: 0.3 }));
         
-        model.add(tf.layers.conv1d({
-            filters: 32,
-            kernelSize: 3,
-            activation: 'relu',
-            padding: 'same'
+        // tf.layers has no separableConv1d, so run the depthwise-separable conv
+        // as a separableConv2d over a width-1 spatial axis.
+        model.add(tf.layers.reshape({ targetShape: [-1, 1, stemFilters] }));
+        model.add(tf.layers.separableConv2d({
+            filters: blockFilters,
+            kernelSize: [3, 1],
+            padding: 'same',
+            useBias: false
         }));
+        model.add(tf.layers.reshape({ targetShape: [-1, blockFilters] }));
         
         model.add(tf.layers.batchNormalization());
+        model.add(tf.layers.activation({ activation: 'relu' }));
         model.add(tf.layers.globalMaxPooling1d());
         model.add(tf.layers.dropout({ rate: 0.3 }));
         
@@ -101,7 +138,7 @@ class ModelBuilder {
 
         model.compile({
             optimizer: tf.train.adam(0.001),
-            loss: 'categoricalCrossentropy',
+            loss: 'sparseCategoricalCrossentropy',
             metrics: ['accuracy']
         });
 
@@ -153,7 +190,7 @@ class ModelBuilder {
 
         model.compile({
             optimizer: tf.train.adam(0.0005),
-            loss: 'categoricalCrossentropy',
+            loss: 'sparseCategoricalCrossentropy',
             metrics: ['accuracy']
         });
 
@@ -190,7 +227,7 @@ class ModelBuilder {
 
         model.compile({
             optimizer: tf.train.adam(0.001),
-            loss: 'categoricalCrossentropy',
+            loss: 'sparseCategoricalCrossentropy',
             metrics: ['accuracy']
         });
 
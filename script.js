@@ -6,13 +6,14 @@ class DNAClassifier {
         this.isTraining = false;
         this.shouldStopTraining = false;
         this.trainingWorker = null;
-        this.classLabels = ['Human', 'Bacteria', 'Virus', 'Plant'];
+        this.classLabels = DataLoader.CLASS_LABELS;
         this.featureNames = [
             'GC_Content', 'AT_Content', 'Sequence_Length', 
             'Num_A', 'Num_T', 'Num_C', 'Num_G', 'kmer_3_freq'
         ];
         this.modelType = 'improved_dense';
         this.trainingHistory = [];
+        this.predictionBuffer = new Float32Array(DataLoader.NUM_FEATURES);
         this.tfjsVersion = tf.version.tfjs;
         
         this.init();
@@ -22,6 +23,19 @@ class DNAClassifier {
         this.setupEventListeners();
         this.log('DNA Classifier System Initialized', 'success');
         this.log(`TensorFlow.js Version: ${this.tfjsVersion}`, 'info');
+        this.reportBackend().catch(error => {
+            this.log(`Backend initialization error: ${error.message}`, 'error');
+        });
+    }
+
+    async reportBackend() {
+        await tf.ready();
+        const precision = tf.backend().floatPrecision();
+        this.log(`TensorFlow.js Backend: ${tf.getBackend()} (${precision}-bit float)`, 'info');
+
+        if (precision < 32) {
+            this.log('Warning: This device only supports 16-bit float textures. Training may be less stable.', 'warning');
+        }
     }
 
     setupEventListeners() {
@@ -80,7 +94,7 @@ class DNAClassifier {
             const reader = new FileReader();
             reader.onload = (e) => {
                 const content = e.target.result;
-                const firstLine = content.split('\n')[0];
+                const firstLine = content.split('\n', 1)[0];
                 
                 if (firstLine.includes('\t')) {
                     resolve('\t');
@@ -92,7 +106,8 @@ class DNAClassifier {
                     resolve('\t');
                 }
             };
-            reader.readAsText(file);
+            // Only the header line is needed, so avoid decoding the whole file.
+            reader.readAsText(file.slice(0, 64 * 1024));
         });
     }
 
@@ -106,10 +121,10 @@ class DNAClassifier {
             const delimiter = await this.detectDelimiter(file);
             this.log(`Detected delimiter: ${delimiter === '\t' ? 'tab' : delimiter}`);
             
-            const data = await DataLoader.loadCSV(file, delimiter);
+            const data = await DataLoader.loadDataset(file, delimiter);
             
             if (dataType === 'train') {
-                this.trainData = DataLoader.processData(data);
+                this.trainData = data;
                 document.getElementById('trainSamples').textContent = this.trainData.features.length;
                 
                 const distribution = this.trainData.analysis.classDistribution;
@@ -123,7 +138,7 @@ class DNAClassifier {
                     this.log(`GC Content analysis - Min: ${stats.min.toFixed(2)}, Max: ${stats.max.toFixed(2)}, Mean: ${stats.mean.toFixed(2)}`);
                 }
             } else {
-                this.testData = DataLoader.processData(data);
+                this.testData = data;
                 document.getElementById('testSamples').textContent = this.testData.features.length;
                 this.log(`Testing data loaded successfully: ${this.testData.features.length} samples`);
             }
@@ -173,6 +188,7 @@ class DNAClassifier {
 
             if (!this.shouldStopTraining) {
                 this.log('Model training completed successfully!', 'success');
+                await ModelBuilder.warmUp(this.model);
                 this.updateModelInfo();
                 await this.evaluateOnTrainData();
             }
@@ -231,15 +247,14 @@ class DNAClassifier {
     async trainRNNModel(config) {
         this.log('Using optimized training for RNN model...', 'info');
         
-        const { features, labels } = this.trainData;
+        const { features } = this.trainData;
         this.model = ModelBuilder.createModel(
             features[0].length, 
             this.classLabels.length,
             this.modelType
         );
 
-        const xs = this.prepareRNNData(features);
-        const ys = tf.oneHot(tf.tensor1d(labels, 'int32'), this.classLabels.length);
+        const datasets = this.createTrainingDatasets(this.trainData, config);
 
         let bestValAcc = 0;
         let patienceCounter = 0;
@@ -252,10 +267,9 @@ class DNAClassifier {
                     break;
                 }
 
-                const history = await this.model.fit(xs, ys, {
+                const history = await this.model.fitDataset(datasets.trainDataset, {
                     epochs: 1,
-                    batchSize: config.batchSize,
-                    validationSplit: config.validationSplit,
+                    validationData: datasets.validationDataset,
                     verbose: 0
                 });
 
@@ -301,13 +315,12 @@ class DNAClassifier {
             }
 
         } finally {
-            if (xs) xs.dispose();
-            if (ys) ys.dispose();
+            datasets.dispose();
         }
     }
 
     async trainStandardModel(config) {
-        const { features, labels } = this.trainData;
+        const { features } = this.trainData;
         
         this.model = ModelBuilder.createModel(
             features[0].length, 
@@ -315,18 +328,16 @@ class DNAClassifier {
             this.modelType
         );
 
-        const xs = tf.tensor2d(features);
-        const ys = tf.oneHot(tf.tensor1d(labels, 'int32'), this.classLabels.length);
+        const datasets = this.createTrainingDatasets(this.trainData, config);
 
         let bestValAcc = 0;
         let patienceCounter = 0;
         this.trainingHistory = [];
 
         try {
-            await this.model.fit(xs, ys, {
+            await this.model.fitDataset(datasets.trainDataset, {
                 epochs: config.epochs,
-                batchSize: config.batchSize,
-                validationSplit: config.validationSplit,
+                validationData: datasets.validationDataset,
                 callbacks: {
                     onEpochEnd: async (epoch, logs) => {
                         if (this.shouldStopTraining) {
@@ -336,7 +347,7 @@ class DNAClassifier {
 
                         const currentValAcc = logs.val_acc;
                         const currentAcc = logs.acc;
-                        
+                    
                         this.trainingHistory.push({
                             epoch: epoch + 1,
                             accuracy: currentAcc,
@@ -373,13 +384,44 @@ class DNAClassifier {
                     }
                 }
             });
-
         } finally {
-            if (xs) xs.dispose();
-            if (ys) ys.dispose();
+            datasets.dispose();
         }
     }
 
+    createTrainingDatasets(data, config) {
+        const numSamples = data.labels.length;
+        const splitAt = Math.floor(numSamples * (1 - config.validationSplit));
+        const inputShape = this.model.inputs[0].shape.slice(1);
+
+        // Kept on the device for the whole run; each batch is gathered from these.
+        const xs = this.prepareDenseData(data);
+        const ys = this.prepareLabels(data.labels);
+
+        const toDataset = (start, end, shuffle) => tf.data.generator(function* () {
+            const indices = Int32Array.from({ length: end - start }, (_, i) => start + i);
+            if (shuffle) tf.util.shuffle(indices);
+
+            for (let i = 0; i < indices.length; i += config.batchSize) {
+                const batchIndices = indices.subarray(i, i + config.batchSize);
+                yield tf.tidy(() => {
+                    const rows = tf.tensor1d(batchIndices, 'int32');
+                    // Each batch is reshaped to the model input, e.g. [8, 1] for the LSTM.
+                    return {
+                        xs: tf.gather(xs, rows).reshape([-1, ...inputShape]),
+                        ys: tf.gather(ys, rows)
+                    };
+                });
+            }
+        }).prefetch(2);
+
+        return {
+            trainDataset: toDataset(0, splitAt, true),
+            validationDataset: toDataset(splitAt, numSamples, false),
+            dispose: () => tf.dispose([xs, ys])
+        };
+    }
+
     stopTraining() {
         if (this.isTraining) {
             this.shouldStopTraining = true;
@@ -417,13 +459,22 @@ class DNAClassifier {
         await tf.nextFrame();
     }
 
-    prepareRNNData(features) {
+    prepareLabels(labels) {
+        if (this.model && this.model.loss === 'categoricalCrossentropy') {
+            // Models saved before the switch to sparse labels still expect one-hot targets.
+            return tf.tidy(() => tf.oneHot(tf.tensor1d(labels, 'int32'), this.classLabels.length));
+        }
+        return tf.tensor2d(labels, [labels.length, 1]);
+    }
+
+    prepareDenseData(data) {
+        const { featureMatrix, features } = data;
+        return tf.tensor2d(featureMatrix, [features.length, features[0].length]);
+    }
+
+    prepareRNNData(data) {
         const timesteps = 8;
-        const reshapedFeatures = features.map(featureArray => {
-            return featureArray.map(value => [value]);
-        });
-        
-        return tf.tensor3d(reshapedFeatures, [features.length, timesteps, 1]);
+        return tf.tensor3d(data.featureMatrix, [data.features.length, timesteps, 1]);
     }
 
     async evaluateOnTrainData() {
@@ -433,15 +484,15 @@ class DNAClassifier {
         
         let xs, ys, evaluation;
         try {
-            const { features, labels } = this.trainData;
+            const { labels } = this.trainData;
             
             if (this.modelType === 'rnn') {
-                xs = this.prepareRNNData(features);
+                xs = this.prepareRNNData(this.trainData);
             } else {
-                xs = tf.tensor2d(features);
+                xs = this.prepareDenseData(this.trainData);
             }
             
-            ys = tf.oneHot(tf.tensor1d(labels, 'int32'), this.classLabels.length);
+            ys = this.prepareLabels(labels);
 
             evaluation = this.model.evaluate(xs, ys);
             const loss = evaluation[0].dataSync()[0];
@@ -475,15 +526,15 @@ class DNAClassifier {
 
         let xs, ys, evaluation;
         try {
-            const { features, labels } = this.testData;
+            const { labels } = this.testData;
             
             if (this.modelType === 'rnn') {
-                xs = this.prepareRNNData(features);
+                xs = this.prepareRNNData(this.testData);
             } else {
-                xs = tf.tensor2d(features);
+                xs = this.prepareDenseData(this.testData);
             }
             
-            ys = tf.oneHot(tf.tensor1d(labels, 'int32'), this.classLabels.length);
+            ys = this.prepareLabels(labels);
 
             evaluation = this.model.evaluate(xs, ys);
             const loss = evaluation[0].dataSync()[0];
@@ -514,61 +565,91 @@ class DNAClassifier {
 
         const indices = [];
         const sampleCount = Math.min(3, features.length);
+        if (sampleCount === 0) {
+            this.log('Error: No valid test samples available.', 'error');
+            return;
+        }
+
         for (let i = 0; i < sampleCount; i++) {
             indices.push(Math.floor(Math.random() * features.length));
         }
 
         let correctPredictions = 0;
+        const predictions = await this.predictBatch(indices.map(index => features[index]));
 
-        for (const index of indices) {
-            const feature = features[index];
+        indices.forEach((index, i) => {
             const trueLabel = labels[index];
             const sequence = rawData[index].Sequence || 'N/A';
 
-            let inputTensor, prediction;
-            try {
-                if (this.modelType === 'rnn') {
-                    const rnnFeature = feature.map(value => [value]);
-                    inputTensor = tf.tensor3d([rnnFeature], [1, 8, 1]);
-                    this.log(`RNN test input shape: [${inputTensor.shape}]`, 'info');
-                } else {
-                    inputTensor = tf.tensor2d([feature]);
-                }
-                
-                prediction = this.model.predict(inputTensor);
-                const results = await prediction.data();
-                
-                const predictedClassIndex = results.indexOf(Math.max(...results));
-                const predictedClass = this.classLabels[predictedClassIndex];
-                const trueClass = this.classLabels[trueLabel];
-                const confidence = Math.max(...results) * 100;
-
-                if (predictedClass === trueClass) {
-                    correctPredictions++;
-                }
+            const predictedClass = this.classLabels[predictions[i].classIndex];
+            const trueClass = this.classLabels[trueLabel];
+            const confidence = predictions[i].confidence * 100;
 
-                const resultDiv = document.createElement('div');
-                resultDiv.className = `random-test-item ${predictedClass === trueClass ? '' : 'error'}`;
-                resultDiv.innerHTML = `
-                    <strong>Sample ${index + 1}</strong><br>
-                    <small>Sequence: ${sequence.substring(0, 50)}${sequence.length > 50 ? '...' : ''}</small><br>
-                    True Label: <strong>${trueClass}</strong> | Predicted: <strong>${predictedClass}</strong><br>
-                    Confidence: ${confidence.toFixed(2)}%<br>
-                    ${predictedClass === trueClass ? '✅ Correct' : '❌ Incorrect'}
-                `;
-
-                resultsContainer.appendChild(resultDiv);
-            } finally {
-                if (inputTensor) inputTensor.dispose();
-                if (prediction) prediction.dispose();
+            if (predictedClass === trueClass) {
+                correctPredictions++;
             }
-        }
+
+            const resultDiv = document.createElement('div');
+            resultDiv.className = `random-test-item ${predictedClass === trueClass ? '' : 'error'}`;
+            resultDiv.innerHTML = `
+                <strong>Sample ${index + 1}</strong><br>
+                <small>Sequence: ${sequence.substring(0, 50)}${sequence.length > 50 ? '...' : ''}</small><br>
+                True Label: <strong>${trueClass}</strong> | Predicted: <strong>${predictedClass}</strong><br>
+                Confidence: ${confidence.toFixed(2)}%<br>
+                ${predictedClass === trueClass ? '✅ Correct' : '❌ Incorrect'}
+            `;
+
+            resultsContainer.appendChild(resultDiv);
+        });
 
         const accuracy = (correctPredictions / sampleCount) * 100;
         this.log(`Random testing completed. Accuracy: ${accuracy.toFixed(2)}% (${correctPredictions}/${sampleCount} correct)`, 
                  accuracy > 70 ? 'success' : 'warning');
     }
 
+    async predictBatch(featureRows) {
+        const batchSize = featureRows.length;
+        if (batchSize === 0) return [];
+
+        const numFeatures = featureRows[0].length;
+        const buffer = new Float32Array(batchSize * numFeatures);
+        featureRows.forEach((row, i) => buffer.set(row, i * numFeatures));
+
+        return this.predictBuffer(buffer, batchSize, numFeatures);
+    }
+
+    async predictBuffer(buffer, batchSize, numFeatures) {
+        const shape = this.modelType === 'rnn' ?
+            [batchSize, numFeatures, 1] :
+            [batchSize, numFeatures];
+
+        let inputTensor, prediction;
+        try {
+            inputTensor = tf.tensor(buffer, shape);
+            if (this.modelType === 'rnn') {
+                this.log(`RNN test input shape: [${inputTensor.shape}]`, 'info');
+            }
+
+            // The input is already a single batch, so skip predict()'s
+            // batch-splitting and concatenation and run it directly.
+            prediction = this.model.predictOnBatch(inputTensor);
+            const probabilities = await prediction.data();
+            const numClasses = prediction.shape[1];
+
+            return Array.from({ length: batchSize }, (_, i) => {
+                const results = probabilities.subarray(i * numClasses, (i + 1) * numClasses);
+                let classIndex = 0;
+                for (let j = 1; j < numClasses; j++) {
+                    if (results[j] > results[classIndex]) classIndex = j;
+                }
+                return { classIndex, confidence: results[classIndex], probabilities: results };
+            });
+        } finally {
+            if (inputTensor) inputTensor.dispose();
+            if (prediction) prediction.dispose();
+        }
+    }
+
     async testSingleSequence() {
         const sequenceInput = document.getElementById('singleSequence').value.trim().toUpperCase();
         
@@ -587,38 +668,64 @@ class DNAClassifier {
             return;
         }
 
-        let inputTensor, prediction;
         try {
-            const features = DataLoader.extractFeaturesFromSequence(sequenceInput, 3);
+            // The feature panel is rendered before awaiting, since another click
+            // can refill the shared buffer while this prediction is pending.
+            const features = DataLoader.extractFeaturesFromSequence(sequenceInput, 3, this.predictionBuffer);
+            const featureAnalysis = `
+            <div class="feature-analysis">
+                <h4>Sequence Analysis</h4>
+                <div class="feature-grid">
+                    <div class="feature-item">
+                        <span class="feature-name">GC Content:</span>
+                        <span class="feature-value">${(features[0] * 100).toFixed(2)}%</span>
+                    </div>
+                    <div class="feature-item">
+                        <span class="feature-name">AT Content:</span>
+                        <span class="feature-value">${(features[1] * 100).toFixed(2)}%</span>
+                    </div>
+                    <div class="feature-item">
+                        <span class="feature-name">Sequence Length:</span>
+                        <span class="feature-value">${features[2]}</span>
+                    </div>
+                    <div class="feature-item">
+                        <span class="feature-name">A Count:</span>
+                        <span class="feature-value">${features[3]}</span>
+                    </div>
+                    <div class="feature-item">
+                        <span class="feature-name">T Count:</span>
+                        <span class="feature-value">${features[4]}</span>
+                    </div>
+                    <div class="feature-item">
+                        <span class="feature-name">C Count:</span>
+                        <span class="feature-value">${features[5]}</span>
+                    </div>
+                    <div class="feature-item">
+                        <span class="feature-name">G Count:</span>
+                        <span class="feature-value">${features[6]}</span>
+                    </div>
+                    <div class="feature-item">
+                        <span class="feature-name">3-mer Frequency:</span>
+                        <span class="feature-value">${features[7].toFixed(4)}</span>
+                    </div>
+                </div>
+            </div>
+            `;
             
-            if (this.modelType === 'rnn') {
-                if (features.length !== 8) {
-                    this.log(`Warning: Feature count (${features.length}) doesn't match RNN expected (8). Adjusting...`, 'warning');
-                    const adjustedFeatures = new Array(8).fill(0);
-                    features.forEach((val, idx) => {
-                        if (idx < 8) adjustedFeatures[idx] = val;
-                    });
-                    features.length = 0;
-                    features.push(...adjustedFeatures);
-                }
-                
-                const rnnFeatures = features.map(value => [value]);
-                inputTensor = tf.tensor3d([rnnFeatures], [1, 8, 1]);
-                this.log(`RNN input shape: [${inputTensor.shape}]`, 'info');
-            } else {
+            let inputDim = features.length;
+            if (this.modelType !== 'rnn') {
                 const modelInputDim = this.model.inputs[0].shape[1];
                 if (features.length !== modelInputDim) {
                     this.log(`Warning: Feature dimension (${features.length}) doesn't match model input (${modelInputDim}). Adjusting...`, 'warning');
-                    features.length = Math.min(features.length, modelInputDim);
                 }
-                inputTensor = tf.tensor2d([features]);
+                inputDim = Math.min(features.length, modelInputDim);
             }
             
-            prediction = this.model.predict(inputTensor);
-            const results = await prediction.data();
-            
-            const maxConfidence = Math.max(...results);
-            const predictedClassIndex = results.indexOf(maxConfidence);
+            const [{
+                classIndex: predictedClassIndex,
+                confidence: maxConfidence,
+                probabilities: results
+            }] = await this.predictBuffer(features.subarray(0, inputDim), 1, inputDim);
             
             let predictedClass;
             if (predictedClassIndex < this.classLabels.length) {
@@ -648,43 +755,7 @@ class DNAClassifier {
                         return `${label}: ${(confidence * 100).toFixed(2)}%`;
                     }).join(' | ')}
                 </div>
-                <div class="feature-analysis">
-                    <h4>Sequence Analysis</h4>
-                    <div class="feature-grid">
-                        <div class="feature-item">
-                            <span class="feature-name">GC Content:</span>
-                            <span class="feature-value">${(features[0] * 100).toFixed(2)}%</span>
-                        </div>
-                        <div class="feature-item">
-                            <span class="feature-name">AT Content:</span>
-                            <span class="feature-value">${(features[1] * 100).toFixed(2)}%</span>
-                        </div>
-                        <div class="feature-item">
-                            <span class="feature-name">Sequence Length:</span>
-                            <span class="feature-value">${features[2]}</span>
-                        </div>
-                        <div class="feature-item">
-                            <span class="feature-name">A Count:</span>
-                            <span class="feature-value">${features[3]}</span>
-                        </div>
-                        <div class="feature-item">
-                            <span class="feature-name">T Count:</span>
-                            <span class="feature-value">${features[4]}</span>
-                        </div>
-                        <div class="feature-item">
-                            <span class="feature-name">C Count:</span>
-                            <span class="feature-value">${features[5]}</span>
-                        </div>
-                        <div class="feature-item">
-                            <span class="feature-name">G Count:</span>
-                            <span class="feature-value">${features[6]}</span>
-                        </div>
-                        <div class="feature-item">
-                            <span class="feature-name">3-mer Frequency:</span>
-                            <span class="feature-value">${features[7].toFixed(4)}</span>
-                        </div>
-                    </div>
-                </div>
+                ${featureAnalysis}
             `;
 
             this.log(`Single sequence test completed: ${predictedClass} (${(maxConfidence * 100).toFixed(2)}% confidence)`, 'success');
@@ -692,9 +763,6 @@ class DNAClassifier {
         } catch (error) {
             this.log(`Single sequence test error: ${error.message}`, 'error');
             console.error('Test error details:', error);
-        } finally {
-            if (inputTensor) inputTensor.dispose();
-            if (prediction) prediction.dispose();
         }
     }
 
@@ -707,16 +775,6 @@ class DNAClassifier {
         this.log('Saving model...');
 
         try {
-            const modelJson = this.model.toJSON();
-            const modelJsonStr = JSON.stringify(modelJson);
-            const modelJsonBlob = new Blob([modelJsonStr], { type: 'application/json' });
-            
-            const modelJsonUrl = URL.createObjectURL(modelJsonBlob);
-            const modelJsonLink = document.createElement('a');
-            modelJsonLink.href = modelJsonUrl;
-            modelJsonLink.download = 'dna-classifier-model.json';
-            modelJsonLink.click();
-
             await this.model.save('downloads://dna-classifier-model');
 
             this.log('Model saved successfully! Check your downloads folder for dna-classifier-model.json and dna-classifier-model.weights.bin', 'success');